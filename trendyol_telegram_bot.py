@@ -8,6 +8,7 @@ import toml
 import html
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # --- Ayarlar ve Sabitler ---
 SECRETS_PATH = Path(".streamlit/secrets.toml")
@@ -26,17 +27,48 @@ def load_secrets():
             return toml.load(f)
     return {}
 
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 200 # Bu değerin üzerindeki sayfa boyutları API tarafından reddedilebilir
+
+def parse_page_size(value):
+    # Hatalı bir ayar botu açılışta çökertmesin; geçersizse varsayılana dön, fazlaysa sınıra çek
+    try:
+        if isinstance(value, bool):
+            raise ValueError
+        size = int(value)
+    except (TypeError, ValueError):
+        print(f"Uyarı: Geçersiz page_size değeri ({value!r}), {DEFAULT_PAGE_SIZE} kullanılıyor.")
+        return DEFAULT_PAGE_SIZE
+    if size < 1:
+        print(f"Uyarı: page_size en az 1 olmalı ({size}), {DEFAULT_PAGE_SIZE} kullanılıyor.")
+        return DEFAULT_PAGE_SIZE
+    if size > MAX_PAGE_SIZE:
+        print(f"Uyarı: page_size en fazla {MAX_PAGE_SIZE} olabilir ({size}), {MAX_PAGE_SIZE} kullanılıyor.")
+        return MAX_PAGE_SIZE
+    return size
+
 secrets = load_secrets()
 ty_secrets = secrets.get("trendyol", {})
 SELLER_ID = ty_secrets.get("seller_id", "")
 API_KEY = ty_secrets.get("api_key", "")
 API_SECRET = ty_secrets.get("api_secret", "")
+# Çok sayfalı kataloglarda sayfaları aynı anda çekmek için (rate limit riskine karşı varsayılan kapalı)
+# (secrets.toml'da tırnaklı "false" gibi değerler açık sayılmasın diye yalnızca gerçek true kabul edilir)
+PARALLEL_FETCH = ty_secrets.get("parallel_fetch", False) is True
+PARALLEL_WORKERS = 4
+PARALLEL_MIN_PAGES = 5 # Bundan az sayfada thread havuzu kurmaya değmez, sıralı çekilir
+# Sayfa başına ürün sayısı; büyük kataloglarda artırmak istek sayısını azaltır
+PAGE_SIZE = parse_page_size(ty_secrets.get("page_size", DEFAULT_PAGE_SIZE))
 
 tg_secrets = secrets.get("telegram", {})
 BOT_TOKEN = tg_secrets.get("bot_token", "")
 CHAT_ID = tg_secrets.get("chat_id", "")
 REPORT_TIME = tg_secrets.get("report_time", "20:00") # Her gün saat kaçta çalışacağı
 
+# Trendyol sayfaları ve ardışık Telegram mesajları aynı TCP/TLS bağlantısını kullansın diye
+# tüm HTTP çağrıları tek bir oturum üzerinden yapılır (keep-alive)
+SESSION = requests.Session()
+
 # --- Telegram Bot API İşlevleri ---
 def send_telegram_message(text):
     if not BOT_TOKEN or not CHAT_ID:
@@ -50,7 +82,7 @@ def send_telegram_message(text):
         "parse_mode": "HTML"
     }
     try:
-        requests.post(url, json=payload)
+        SESSION.post(url, json=payload)
     except Exception as e:
         print(f"Telegram mesajı gönderilirken hata oluştu: {e}")
 
@@ -67,7 +99,7 @@ def send_telegram_photo(photo_url, caption):
         "parse_mode": "HTML"
     }
     try:
-        resp = requests.post(url, json=payload)
+        resp = SESSION.post(url, json=payload)
         # Eğer resim url'si geçersiz veya erişilemezse normal mesaj olarak atmayı dener
         if resp.status_code != 200:
             send_telegram_message(caption + f"\n\n[Görsel Yüklenemedi: {photo_url}]")
@@ -80,6 +112,32 @@ def get_auth_header(api_key, api_secret):
     encoded = base64.b64encode(credentials.encode()).decode('utf-8')
     return {"Authorization": f"Basic {encoded}"}
 
+def fetch_trendyol_page(url, headers, page, size, session=SESSION):
+    params = {
+        "page": page,
+        "size": size,
+        "approved": "true",
+        "archived": "false"
+    }
+    response = session.get(url, headers=headers, params=params)
+    
+    if response.status_code != 200:
+        print(f"Trendyol API Hatası: {response.status_code} - {response.text}")
+        return None
+    
+    return response.json()
+
+def fetch_trendyol_pages(url, headers, pages, size):
+    # requests.Session thread-safe olmadığı için her iş parçacığı kendi oturumunu kullanır
+    with requests.Session() as session:
+        results = []
+        for page in pages:
+            data = fetch_trendyol_page(url, headers, page, size, session)
+            if data is None:
+                return None
+            results.append(data)
+        return results
+
 def fetch_trendyol_products():
     if not SELLER_ID or not API_KEY or not API_SECRET:
         print("Trendyol API bilgileri eksik. Kontrol ediliyor...")
@@ -90,33 +148,56 @@ def fetch_trendyol_products():
     headers["User-Agent"] = f"{SELLER_ID} - SelfIntegration"
     
     all_products = []
-    page = 0
-    size = 100
+    size = PAGE_SIZE
     
     try:
-        while True:
-            params = {
-                "page": page,
-                "size": size,
-                "approved": "true",
-                "archived": "false"
-            }
-            response = requests.get(url, headers=headers, params=params)
-            
-            if response.status_code != 200:
-                print(f"Trendyol API Hatası: {response.status_code} - {response.text}")
-                return None
+        # İlk sayfa toplam sayfa sayısını öğrenmek için her zaman tek başına çekilir
+        data = fetch_trendyol_page(url, headers, 0, size)
+        if data is None:
+            return None
+        
+        content = data.get("content", [])
+        all_products.extend(content)
+        
+        total_pages = data.get("totalPages", 1)
+        
+        if total_pages <= 1 or len(content) == 0:
+            return all_products
+        
+        if PARALLEL_FETCH and total_pages >= PARALLEL_MIN_PAGES:
+            # Kalan sayfalar ardışık gruplara bölünüp paralel çekilir, sonra sırayla birleştirilir
+            remaining = list(range(1, total_pages))
+            step = -(-len(remaining) // PARALLEL_WORKERS)
+            groups = [remaining[i:i + step] for i in range(0, len(remaining), step)]
             
-            data = response.json()
-            content = data.get("content", [])
-            all_products.extend(content)
+            with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+                results = list(executor.map(
+                    lambda g: fetch_trendyol_pages(url, headers, g, size),
+                    groups
+                ))
             
-            total_pages = data.get("totalPages", 1)
+            if any(r is None for r in results):
+                return None
             
-            if page + 1 >= total_pages or len(content) == 0:
-                break
+            for group in results:
+                for d in group:
+                    all_products.extend(d.get("content", []))
+        else:
+            page = 1
+            while True:
+                data = fetch_trendyol_page(url, headers, page, size)
+                if data is None:
+                    return None
+                
+                content = data.get("content", [])
+                all_products.extend(content)
                 
-            page += 1
+                total_pages = data.get("totalPages", 1)
+                
+                if page + 1 >= total_pages or len(content) == 0:
+                    break
+                    
+                page += 1
             
         return all_products
     except Exception as e: